@@ -14,6 +14,7 @@ from .cookie import CookieHandler
 from .db import upgrade_table
 from .distgit import DistGitHandler
 from .fas import FasHandler
+from .handler import Handler
 from .infra import InfraHandler
 from .pagureio import PagureIOHandler
 
@@ -26,18 +27,41 @@ class Fedora(Plugin):
         return upgrade_table
 
     async def start(self) -> None:
+        self.handlers: list[Handler] = []
         assert self.config  # noqa: S101 # This is a valid use of assert
         self.config.load_and_update()
-        self.fasjsonclient = FasjsonClient(self.config["fasjson_url"])
-        self.register_handler_class(PagureIOHandler(self))
-        self.register_handler_class(DistGitHandler(self))
-        self.register_handler_class(FasHandler(self))
-        self.register_handler_class(InfraHandler(self))
-        self.register_handler_class(BugzillaHandler(self))
-        self.register_handler_class(CookieHandler(self))
+        self.fasjsonclient = FasjsonClient(
+            self.config["fasjson_url"],
+            cache_policy=self.config["cache_policy"],
+            cache_fallback=self.config["cache_fallback_enabled"],
+        )
+        for handler_class in (
+            PagureIOHandler,
+            DistGitHandler,
+            FasHandler,
+            InfraHandler,
+            BugzillaHandler,
+            CookieHandler,
+        ):
+            handler = handler_class(self)
+            # Keep track of the handlers as they're built, so that stop() can clean up
+            # after a failed start()
+            self.handlers.append(handler)
+            self.register_handler_class(handler)
+        # The commands don't change once registered, render the help texts only once
+        commands = list(self._get_handler_commands())
+        self._commands_help = {cmd.__mb_name__: cmd.__mb_full_help__ for cmd in commands}
+        self._help_listing = NL.join(
+            f"* `{cmd.__mb_prefix__} {cmd.__mb_usage_args__}` - {cmd.__mb_help__}"
+            for cmd in commands
+        )
 
     async def stop(self) -> None:
-        pass
+        for handler in self.handlers:
+            await handler.stop()
+        # start() may have failed before creating the client
+        if hasattr(self, "fasjsonclient"):
+            await self.fasjsonclient.close()
 
     @classmethod
     def get_config_class(cls) -> type[BaseProxyConfig]:
@@ -56,25 +80,16 @@ class Fedora(Plugin):
     @command.argument("commandname", pass_raw=True, required=False)
     async def bothelp(self, evt: MessageEvent, commandname: str) -> None:
         """return help"""
-        output = []
-
-        if commandname:
-            # return the full help (docstring) for the given command
-            for cmd in self._get_handler_commands():
-                if commandname != cmd.__mb_name__:
-                    continue
-                output.append(cmd.__mb_full_help__)
-                break
-            else:
-                await evt.reply(f"`{commandname}` is not a valid command")
-                return
-        else:
+        if not commandname:
             # list all the commands with the help arg from command.new
-            for cmd in self._get_handler_commands():
-                output.append(
-                    f"* `{cmd.__mb_prefix__} {cmd.__mb_usage_args__}` - {cmd.__mb_help__}"
-                )
-        await evt.respond(NL.join(output))
+            await evt.respond(self._help_listing)
+            return
+
+        # return the full help (docstring) for the given command
+        if commandname not in self._commands_help:
+            await evt.reply(f"`{commandname}` is not a valid command")
+            return
+        await evt.respond(self._commands_help[commandname])
 
     @command.new(help="return information about this bot")
     async def version(self, evt: MessageEvent) -> None:
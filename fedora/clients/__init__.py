@@ -0,0 +1,7 @@
+# Clients for the external services the bot talks to: FASJSON (users and groups), Pagure
+# (pagure.io issues and src.fedoraproject.org packages), Bodhi, Bugzilla and Fedora Status.
+#
+# The commands do very little computing: their latency is the round-trips to these services.
+# Every request logs how long it took at the DEBUG level, use that to spot regressions and to
+# tune the FASJSON cache lifetimes (the cache_policy option) rather than optimizing the Python
+# side.
@@ -1,7 +1,11 @@
+import logging
+
 import httpx
 
 from ..exceptions import InfoGatherError
 
+log = logging.getLogger(__name__)
+
 
 class BodhiClient:
     def __init__(self, baseurl):
@@ -11,6 +15,7 @@ class BodhiClient:
         kwargs.setdefault("headers", {})["Content-Type"] = "application/json"
         async with httpx.AsyncClient() as client:
             response = await client.get(self.baseurl + endpoint, **kwargs)
+        log.debug("Bodhi request to %s took %.3fs", response.url, response.elapsed.total_seconds())
         return response
 
     def _check_errors(self, response):
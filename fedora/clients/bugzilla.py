@@ -1,7 +1,11 @@
+import logging
+
 import httpx
 
 from ..exceptions import InfoGatherError
 
+log = logging.getLogger(__name__)
+
 
 class BugzillaClient:
     def __init__(self, baseurl):
@@ -10,6 +14,9 @@ class BugzillaClient:
     async def _get(self, endpoint, **kwargs):
         async with httpx.AsyncClient() as client:
             response = await client.get(self.baseurl + endpoint, **kwargs)
+        log.debug(
+            "Bugzilla request to %s took %.3fs", response.url, response.elapsed.total_seconds()
+        )
         return response
 
     def _check_errors(self, response):
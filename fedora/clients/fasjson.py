@@ -1,6 +1,7 @@
 import logging
 
 import httpx
+from cachetools import LRUCache, TTLCache
 from httpx_gssapi import HTTPSPNEGOAuth
 
 from ..constants import MATRIX_USER_RE, NL
@@ -14,27 +15,70 @@ class NoResult(Exception):
         self.response = response
 
 
+# How long (in seconds) the lookups are cached, depending on how often the data changes:
+# group memberships are "short", user records "normal" and group information "long".
+DEFAULT_CACHE_POLICY = {"short": 60, "normal": 300, "long": 3600}
+
+
+def _user_not_found(username):
+    return InfoGatherError(f"Sorry, but Fedora Accounts user '{username}' does not exist")
+
+
 class FasjsonClient:
-    def __init__(self, baseurl):
+    def __init__(self, baseurl, cache_policy=None, cache_fallback=False):
         self.baseurl = f"{baseurl}/v1/"
+        # A single client lets the lookups reuse the connections in its pool instead of
+        # opening a new one for every command.
+        self.client = httpx.AsyncClient(
+            auth=HTTPSPNEGOAuth(),
+            follow_redirects=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        # Keep what we looked up recently and spare FASJSON (and ourselves) the round-trip.
+        # Unknown users (usually typos) are only remembered for a short time.
+        cache_policy = {**DEFAULT_CACHE_POLICY, **(cache_policy or {})}
+        self._user_cache = TTLCache(maxsize=1024, ttl=cache_policy["normal"])
+        self._matrix_cache = TTLCache(maxsize=1024, ttl=cache_policy["normal"])
+        self._unknown_user_cache = TTLCache(maxsize=1024, ttl=cache_policy["short"])
+        self._group_membership_cache = TTLCache(maxsize=256, ttl=cache_policy["short"])
+        self._group_cache = TTLCache(maxsize=256, ttl=cache_policy["long"])
+        # Last known-good results, never expired, served when FASJSON is unavailable
+        self.cache_fallback = cache_fallback
+        self._fallback_cache = LRUCache(maxsize=4096)
 
     async def _get(self, endpoint, **kwargs):
-        kwargs["follow_redirects"] = True
-        kwargs["auth"] = HTTPSPNEGOAuth()
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.baseurl + endpoint + "/", **kwargs)
-            if response.status_code == 404:
-                raise NoResult(response)
-            if response.status_code >= 400:
-                log.error(f"FASJSON response to {response.url}: {response.text}")
-                raise InfoGatherError(
-                    f"Sorry, could not get info from FASJSON (code {response.status_code})"
-                )
-            pass
+        response = await self.client.get(self.baseurl + endpoint + "/", **kwargs)
+        log.debug(
+            "FASJSON request to %s took %.3fs", response.url, response.elapsed.total_seconds()
+        )
+        if response.status_code == 404:
+            raise NoResult(response)
+        if response.status_code >= 400:
+            log.error(f"FASJSON response to {response.url}: {response.text}")
+            raise InfoGatherError(
+                f"Sorry, could not get info from FASJSON (code {response.status_code})"
+            )
         return response
 
+    async def close(self):
+        await self.client.aclose()
+
+    def _fallback(self, key, error):
+        if not self.cache_fallback or key not in self._fallback_cache:
+            raise error
+        log.warning(f"FASJSON is unavailable ({error!r}), using the last known value for {key}")
+        return self._fallback_cache[key]
+
+    def _remember(self, key, value):
+        if self.cache_fallback:
+            self._fallback_cache[key] = value
+
     async def get_group_membership(self, groupname, membership_type="members", params=None):
         """looks up a group membership (members or sponsors) by the groupname"""
+        cache_key = (groupname, membership_type)
+        if params is None and cache_key in self._group_membership_cache:
+            return self._group_membership_cache[cache_key]
         try:
             response = await self._get(
                 "/".join(["groups", groupname, membership_type]),
@@ -43,25 +87,47 @@ class FasjsonClient:
             )
         except NoResult as e:
             raise InfoGatherError(f"Sorry, but group '{groupname}' does not exist") from e
-        return response.json().get("result")
+        members = response.json().get("result")
+        if params is None:
+            self._group_membership_cache[cache_key] = members
+        return members
 
     async def get_group(self, groupname, params=None):
         """looks up a group by the groupname"""
+        if params is None and groupname in self._group_cache:
+            return self._group_cache[groupname]
         try:
             response = await self._get("/".join(["groups", groupname]), params=params)
         except NoResult as e:
             raise InfoGatherError(f"Sorry, but group '{groupname}' does not exist") from e
-        return response.json().get("result")
+        group = response.json().get("result")
+        if params is None:
+            self._group_cache[groupname] = group
+        return group
 
     async def get_user(self, username, params=None):
-        """looks up a group by the groupname"""
+        """looks up a user by the username"""
+        # Extra params change the result, only cache the plain lookups
+        cacheable = params is None
+        if cacheable and username in self._user_cache:
+            return self._user_cache[username]
+        if cacheable and username in self._unknown_user_cache:
+            raise _user_not_found(username)
         try:
             response = await self._get("/".join(["users", username]), params=params)
         except NoResult as e:
-            raise InfoGatherError(
-                f"Sorry, but Fedora Accounts user '{username}' does not exist"
-            ) from e
-        return response.json().get("result")
+            if cacheable:
+                self._unknown_user_cache[username] = True
+            raise _user_not_found(username) from e
+        except (InfoGatherError, httpx.TransportError) as e:
+            if not cacheable:
+                raise
+            return self._fallback(username, e)
+        user = response.json().get("result")
+        if cacheable:
+            self._user_cache[username] = user
+            self._remember(username, user)
+        return user
 
     async def search_users(self, params=None):
         """looks up a group by the groupname"""
@@ -72,13 +138,18 @@ class FasjsonClient:
         """looks up a user by the matrix id"""
 
         # Fedora Accounts stores these strangly but this is to handle that
-        try:
-            matrix_username, matrix_server = MATRIX_USER_RE.findall(matrix_id)[0]
-        except (ValueError, IndexError) as e:
-            raise InfoGatherError(
-                f"Sorry, {matrix_id} does not look like a valid matrix user ID "
-                "(e.g. @username:homeserver.com )"
-            ) from e
+        # Most IDs are a bare @username:server, split those without the regex engine
+        matrix_username, _, matrix_server = matrix_id[1:].partition(":")
+        has_localpart = matrix_id.startswith("@") and matrix_username
+        # the server part must not be empty nor contain whitespace
+        if not (has_localpart and matrix_server.split() == [matrix_server]):
+            try:
+                matrix_username, matrix_server = MATRIX_USER_RE.findall(matrix_id)[0]
+            except (ValueError, IndexError) as e:
+                raise InfoGatherError(
+                    f"Sorry, {matrix_id} does not look like a valid matrix user ID "
+                    "(e.g. @username:homeserver.com )"
+                ) from e
 
         # if given a fedora.im address -- just look up the username as a FAS name
         if matrix_server == "fedora.im":
@@ -86,7 +157,12 @@ class FasjsonClient:
             return user
 
         searchterm = f"matrix://{matrix_server}/{matrix_username}"
-        searchresult = await self.search_users(params={"ircnick__exact": searchterm})
+        if searchterm in self._matrix_cache:
+            return self._matrix_cache[searchterm]
+        try:
+            searchresult = await self.search_users(params={"ircnick__exact": searchterm})
+        except (InfoGatherError, httpx.TransportError) as e:
+            return self._fallback(searchterm, e)
 
         if len(searchresult) > 1:
             names = f"{NL}".join([name["username"] for name in searchresult])
@@ -100,4 +176,6 @@ class FasjsonClient:
                 f"No Fedora Accounts users have the {matrix_id} Matrix Account defined"
             )
 
+        self._matrix_cache[searchterm] = searchresult[0]
+        self._remember(searchterm, searchresult[0])
         return searchresult[0]
@@ -1,9 +1,12 @@
+import logging
 from typing import Literal
 
 import httpx
 
 from ..exceptions import InfoGatherError
 
+log = logging.getLogger(__name__)
+
 
 class FedoraStatusClient:
     def __init__(self, baseurl):
@@ -13,6 +16,9 @@ class FedoraStatusClient:
         kwargs.setdefault("headers", {})["Content-Type"] = "application/json"
         async with httpx.AsyncClient() as client:
             response = await client.get(self.baseurl + endpoint, **kwargs)
+        log.debug(
+            "Fedora Status request to %s took %.3fs", response.url, response.elapsed.total_seconds()
+        )
         return response
 
     def _check_errors(self, response):
@@ -1,17 +1,32 @@
+import logging
+
 import httpx
 
 from ..exceptions import InfoGatherError
 
+log = logging.getLogger(__name__)
+
 
 class PagureClient:
     def __init__(self, baseurl):
         self.baseurl = f"{baseurl}/api/0/"
+        # Keep a single client around so that consecutive lookups reuse the same
+        # connection pool instead of doing a new TCP + TLS handshake every time.
+        # With HTTP/2, concurrent lookups are multiplexed on that connection.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
 
     async def _get(self, endpoint, **kwargs):
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.baseurl + endpoint, **kwargs)
+        response = await self.client.get(self.baseurl + endpoint, **kwargs)
+        log.debug("Pagure request to %s took %.3fs", response.url, response.elapsed.total_seconds())
         return response
 
+    async def close(self):
+        await self.client.aclose()
+
     def _check_errors(self, response):
         if response.status_code == 404:
             raise InfoGatherError(f"Issue querying Pagure: {response.json().get('error')}")
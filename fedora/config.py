@@ -4,6 +4,10 @@ from mautrix.util.config import BaseProxyConfig, ConfigUpdateHelper
 class Config(BaseProxyConfig):
     def do_update(self, helper: ConfigUpdateHelper) -> None:
         helper.copy("fasjson_url")
+        helper.copy("cache_policy.short")
+        helper.copy("cache_policy.normal")
+        helper.copy("cache_policy.long")
+        helper.copy("cache_fallback_enabled")
         helper.copy("pagureio_url")
         helper.copy("pagureio_issue_aliases")
         helper.copy("paguredistgit_url")
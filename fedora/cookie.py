@@ -170,9 +170,9 @@ class CookieHandler(Handler):
             await evt.respond(f"{user['username']} has no cookies")
             return
 
-        message = f"{user['username']} has {total} cookies:{NL}"
+        message = [f"{user['username']} has {total} cookies:{NL}"]
 
         for release, count in by_release.items():
-            message = message + f" * Fedora {release}: {count} cookies{NL}"
+            message.append(f" * Fedora {release}: {count} cookies{NL}")
 
-        await evt.respond(message)
+        await evt.respond("".join(message))
@@ -12,6 +12,9 @@ class DistGitHandler(Handler):
         super().__init__(plugin)
         self.paguredistgitclient = PagureClient(self.plugin.config["paguredistgit_url"])
 
+    async def stop(self) -> None:
+        await self.paguredistgitclient.close()
+
     @command.new(help="Retrieve the owner of a given package")
     @command.argument("package", required=True)
     async def whoowns(self, evt: MessageEvent, package: str) -> None:
@@ -1,21 +1,42 @@
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
-import pytz
+from cachetools import TTLCache
 from maubot import MessageEvent
 from maubot.handlers import command
 
 from .constants import NL
 from .exceptions import InfoGatherError
 from .handler import Handler
-from .utils import get_fasuser, inline_reply, matrix_ids_from_ircnicks, tag_user
+from .utils import (
+    INVALID_TIMEZONE_ERRORS,
+    get_fasuser,
+    get_timezone,
+    inline_reply,
+    matrix_ids_from_ircnicks,
+    tag_user,
+)
 
 log = logging.getLogger(__name__)
 
+# Groups up to this size are listed in a single message, with mentions
+MAX_MENTIONED_MEMBERS = 200
+# Larger groups are listed in chunks, up to a limit
+MEMBERS_PER_MESSAGE = 100
+MAX_MEMBER_MESSAGES = 10
+
 
 class FasHandler(Handler):
-    async def _get_mentions(self, users, evt: MessageEvent):
-        room_members = set((await evt.client.get_joined_members(evt.room_id)).keys())
+    def __init__(self, plugin):
+        super().__init__(plugin)
+        # Formatted local times by (timezone name, UTC minute)
+        self._localtime_cache = TTLCache(maxsize=512, ttl=30)
+
+    async def _get_room_members(self, evt: MessageEvent) -> set[str]:
+        return set((await evt.client.get_joined_members(evt.room_id)).keys())
+
+    def _get_mentions(self, users, room_members: set[str]):
         mentions = []
         for user in sorted(users, key=lambda u: u["username"]):
             mxids = matrix_ids_from_ircnicks(user.get("ircnicks", []))
@@ -45,22 +66,42 @@ class FasHandler(Handler):
 
         await evt.mark_read()
 
+        # The room members are only needed to pick the right mentions, fetch them from the
+        # homeserver while we're waiting for FASJSON.
+        room_members_task = asyncio.create_task(self._get_room_members(evt))
         try:
             users = await self.plugin.fasjsonclient.get_group_membership(
                 groupname, membership_type=membership_type
             )
         except InfoGatherError as e:
+            room_members_task.cancel()
             await evt.respond(e.message)
             return
+        except BaseException:
+            room_members_task.cancel()
+            raise
 
-        if len(users) > 200:
-            await evt.respond(
-                f"{groupname} has {len(users)} {membership_type} and thats too many to dump here"
-            )
+        if len(users) <= MAX_MENTIONED_MEMBERS:
+            mentions = self._get_mentions(users, await room_members_task)
+            await evt.respond(f"{membership_type.title()} of {groupname}: {', '.join(mentions)}")
             return
 
-        mentions = await self._get_mentions(users, evt)
-        await evt.respond(f"{membership_type.title()} of {groupname}: {', '.join(mentions)}")
+        # Larger groups don't fit in a single message: send the usernames in chunks, without
+        # mentions so that we don't ping hundreds of people.
+        room_members_task.cancel()
+        usernames = sorted(user["username"] for user in users)
+        listed = usernames[: MEMBERS_PER_MESSAGE * MAX_MEMBER_MESSAGES]
+        for start in range(0, len(listed), MEMBERS_PER_MESSAGE):
+            chunk = listed[start : start + MEMBERS_PER_MESSAGE]
+            await evt.respond(
+                f"{membership_type.title()} of {groupname} "
+                f"({start + 1}-{start + len(chunk)} of {len(usernames)}): {', '.join(chunk)}"
+            )
+        if len(usernames) > len(listed):
+            await evt.respond(
+                f"... and {len(usernames) - len(listed)} more, "
+                f"see https://accounts.fedoraproject.org/group/{groupname}/"
+            )
 
     @command.new(help="Query information about Fedora Accounts groups")
     async def group(self, evt: MessageEvent) -> None:
@@ -146,16 +187,21 @@ class FasHandler(Handler):
         if timezone_name is None:
             await evt.reply('User "%s" doesn\'t share their timezone' % user.get("username"))
             return
-        try:
-            time = datetime.now(pytz.timezone(timezone_name))
-        except Exception:
-            await evt.reply(
-                f'The timezone of "{user.get("username")}" was unknown: "{timezone_name}"'
-            )
-            return
+        now = datetime.now(timezone.utc)
+        cache_key = (timezone_name, now.replace(second=0, microsecond=0))
+        formatted = self._localtime_cache.get(cache_key)
+        if formatted is None:
+            try:
+                local_now = now.astimezone(get_timezone(timezone_name))
+            except INVALID_TIMEZONE_ERRORS:
+                await evt.reply(
+                    f'The timezone of "{user.get("username")}" was unknown: "{timezone_name}"'
+                )
+                return
+            formatted = self._localtime_cache[cache_key] = local_now.strftime("%H:%M")
         await evt.respond(
-            f'The current local time of "{user.get("username")}" is: "{time.strftime("%H:%M")}" '
-            f"(timezone: {timezone_name})"
+            f'The current local time of "{user.get("username")}" is: '
+            f'"{formatted}" (timezone: {timezone_name})'
         )
 
     @command.new(help="Get information about Fedora Accounts users")
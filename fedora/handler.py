@@ -1,3 +1,6 @@
 class Handler:
     def __init__(self, plugin):
         self.plugin = plugin
+
+    async def stop(self) -> None:
+        pass
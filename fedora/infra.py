@@ -1,7 +1,6 @@
 import datetime
 import logging
 
-import pytz
 from maubot import MessageEvent
 from maubot.handlers import command
 
@@ -10,7 +9,13 @@ from .constants import COMMAND_RE, NL
 from .db import UNIQUE_ERROR
 from .exceptions import InfoGatherError
 from .handler import Handler
-from .utils import get_fasuser, get_rowcount, matrix_ids_from_ircnicks
+from .utils import (
+    INVALID_TIMEZONE_ERRORS,
+    get_fasuser,
+    get_rowcount,
+    get_timezone,
+    matrix_ids_from_ircnicks,
+)
 
 log = logging.getLogger(__name__)
 
@@ -28,20 +33,23 @@ class InfraHandler(Handler):
             """
         oncall_sysadmins = await self.plugin.database.fetch(dbq)
         if oncall_sysadmins:
-            output = f"The following people are oncall:{NL}"
+            output = [f"The following people are oncall:{NL}"]
             for sysadmin in oncall_sysadmins:
                 timezone = sysadmin["timezone"]
-                currenttime = datetime.datetime.now(pytz.timezone(timezone)).strftime("%H:%M")
-                output = output + (
+                try:
+                    currenttime = datetime.datetime.now(get_timezone(timezone)).strftime("%H:%M")
+                except INVALID_TIMEZONE_ERRORS:
+                    currenttime = "unknown"
+                output.append(
                     f"* { self._format_mxid(sysadmin['mxid'])} "
                     f"({sysadmin['username']}) Current Time for them: "
                     f"{currenttime} ({timezone}){NL}"
                 )
-            output = output + (
+            output.append(
                 "\nIf they do not respond, please "
                 "[file a ticket](https://pagure.io/fedora-infrastructure/issues)"
             )
-            await evt.respond(output, allow_html=True)
+            await evt.respond("".join(output), allow_html=True)
         else:
             await evt.respond("No one from Fedora Infrastructure is currently on call")
 
@@ -150,33 +158,33 @@ class InfraHandler(Handler):
         planned = await self.fedorastatus.get_outages("planned")
         planned = planned.get("outages", [])
 
-        message = f"I checked [Fedora Status]({self.fedorastatus_url}) and there are "
+        message = [f"I checked [Fedora Status]({self.fedorastatus_url}) and there are "]
         if not ongoing and not planned:
-            message = message + f"**no planned or ongoing outages on Fedora Infrastructure.**{NL}"
+            message.append(f"**no planned or ongoing outages on Fedora Infrastructure.**{NL}")
         else:
-            message = message + (
+            message.append(
                 f"**{len(ongoing)} ongoing** and **{len(planned)} planned** "
                 f"outages on Fedora Infrastructure.{NL}"
             )
             if ongoing:
-                message = message + f"##### Ongoing{NL}"
+                message.append(f"##### Ongoing{NL}")
                 for outage in ongoing:
-                    message = message + f" * {format_title(outage)}{NL}"
+                    message.append(f" * {format_title(outage)}{NL}")
                     # TODO: Make these times relative (e.g. started 1 hour ago)
-                    message = message + f"   Started at: {outage['startdate']}{NL}"
-                    message = message + (
+                    message.append(f"   Started at: {outage['startdate']}{NL}")
+                    message.append(
                         f"   Estimated to end: "
                         f"{outage['enddate'] if outage['enddate'] else 'Unknown'}{NL}"
                     )
             if planned:
-                message = message + f"##### Planned{NL}"
+                message.append(f"##### Planned{NL}")
                 for outage in planned:
-                    message = message + f" * {format_title(outage)}{NL}"
+                    message.append(f" * {format_title(outage)}{NL}")
                     # TODO: Make these times relative (e.g. started 1 hour ago)
-                    message = message + f"   Scheduled to start at: {outage['startdate']}{NL}"
-                    message = message + (
+                    message.append(f"   Scheduled to start at: {outage['startdate']}{NL}")
+                    message.append(
                         f"   Scheduled to end at: "
                         f"{outage['enddate'] if outage['enddate'] else 'Unknown'}{NL}"
                     )
 
-        await evt.respond(message)
+        await evt.respond("".join(message))
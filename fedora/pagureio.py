@@ -13,6 +13,9 @@ class PagureIOHandler(Handler):
         super().__init__(plugin)
         self.pagureioclient = PagureClient(self.plugin.config["pagureio_url"])
 
+    async def stop(self) -> None:
+        await self.pagureioclient.close()
+
     async def _get_pagure_issue(self, evt: MessageEvent, project: str, issue_id: str) -> None:
         await evt.mark_read()
         try:
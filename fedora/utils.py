@@ -1,5 +1,6 @@
-import re
+from functools import lru_cache
 from typing import TypeGuard
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from maubot import MessageEvent
 from mautrix.types import BaseMessageEventContent, MessageType, Obj, TextMessageEventContent
@@ -9,7 +10,34 @@ from .clients.fasjson import FasjsonClient
 from .constants import FAS_MATRIX_DOMAINS, MATRIX_USER_RE
 from .exceptions import InfoGatherError
 
-MENTION_RE = re.compile(r"href=['\"]?http[s]?://matrix.to/#/([^'\" >]+)['\" >]")
+# Mentions are links like href="https://matrix.to/#/@username:server"
+MENTION_URL = "://matrix.to/#/"
+MENTION_PREFIXES = tuple(
+    f"href={quote}{scheme}" for quote in ("", "'", '"') for scheme in ("http", "https")
+)
+MENTION_END = "'\" >"
+
+
+def find_mentions(body: str, limit: int = 2) -> list[str]:
+    """
+    Return the Matrix IDs mentioned in an HTML message body, stopping after `limit` of them
+    """
+    mentions: list[str] = []
+    start = 0
+    while len(mentions) < limit:
+        index = body.find(MENTION_URL, start)
+        if index < 0:
+            break
+        start = index + len(MENTION_URL)
+        if not body.endswith(MENTION_PREFIXES, 0, index):
+            continue
+        end = start
+        while end < len(body) and body[end] not in MENTION_END:
+            end += 1
+        if start < end < len(body):
+            mentions.append(body[start:end])
+        start = end
+    return mentions
 
 
 def get_matrix_id(username: str, evt: MessageEvent):
@@ -23,7 +51,7 @@ def get_matrix_id(username: str, evt: MessageEvent):
         # in element at least, when usernames are mentioned, they are formatted like:
         # <a href="https://matrix.to/#/@zodbot:fedora.im">zodbot</a>
         # here we check the formatted message and extract all the matrix user IDs
-        matches = MENTION_RE.findall(evt.content.formatted_body)
+        matches = find_mentions(evt.content.formatted_body)
         if len(matches) > 1:
             raise InfoGatherError("Sorry, I can only look up one username at a time")
         elif len(matches) == 1:
@@ -79,6 +107,16 @@ def matrix_ids_from_ircnicks(ircnicks):
     return mxids
 
 
+# ZoneInfo does not only raise ZoneInfoNotFoundError for bad names: malformed keys raise
+# ValueError, and names that aren't a zone file (e.g. "Europe", or too long) raise OSError
+INVALID_TIMEZONE_ERRORS = (ZoneInfoNotFoundError, ValueError, OSError)
+
+
+@lru_cache(maxsize=512)
+def get_timezone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
 def tag_user(mxid, name=None):
     return f"[{name or mxid}](https://matrix.to/#/{mxid})"
 
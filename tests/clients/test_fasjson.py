@@ -4,6 +4,7 @@ from unittest import mock
 import httpx
 import pytest
 
+import fedora.clients.fasjson
 from fedora.clients.fasjson import FasjsonClient
 from fedora.exceptions import InfoGatherError
 
@@ -172,3 +173,176 @@ async def test_get_users_by_matrix_id_multiple_users(monkeypatch):
         ),
     ):
         await client.get_users_by_matrix_id("@cookie:biscuit.test")
+
+
+async def test_get_user_cached(monkeypatch):
+    client = FasjsonClient("http://fasjson.example.com")
+    mock__get = mock.AsyncMock(
+        return_value=httpx.Response(200, json={"result": {"username": "biscuit_eater"}})
+    )
+    monkeypatch.setattr(client, "_get", mock__get)
+
+    first = await client.get_user("biscuit_eater")
+    second = await client.get_user("biscuit_eater")
+    mock__get.assert_called_once_with("users/biscuit_eater", params=None)
+    assert first == second == {"username": "biscuit_eater"}
+
+    # Lookups with extra params are not cached
+    await client.get_user("biscuit_eater", params={"fakeparam": True})
+    assert mock__get.call_count == 2
+
+
+async def test_get_user_not_found_cached(respx_mock):
+    client = FasjsonClient("http://fasjson.example.com")
+    route = respx_mock.get("http://fasjson.example.com/v1/users/biscuits_eater/").mock(
+        return_value=httpx.Response(404)
+    )
+    for _ in range(2):
+        with pytest.raises(
+            InfoGatherError, match="Sorry, but Fedora Accounts user 'biscuits_eater' does not exist"
+        ):
+            await client.get_user("biscuits_eater")
+    assert route.call_count == 1
+
+
+async def test_get_users_by_matrix_id_cached(monkeypatch):
+    client = FasjsonClient("http://fasjson.example.com")
+    mock_search_users = mock.AsyncMock(return_value=[{"username": "biscuit_eater"}])
+    monkeypatch.setattr(client, "search_users", mock_search_users)
+
+    first = await client.get_users_by_matrix_id("@cookie:biscuit.test")
+    second = await client.get_users_by_matrix_id("@cookie:biscuit.test")
+    mock_search_users.assert_called_once_with(
+        params={"ircnick__exact": "matrix://biscuit.test/cookie"}
+    )
+    assert first == second == {"username": "biscuit_eater"}
+
+
+async def test_client_reused(respx_mock):
+    client = FasjsonClient("http://fasjson.example.com")
+    respx_mock.get("http://fasjson.example.com").mock(
+        return_value=httpx.Response(200, json={"result": {"username": "biscuit_eater"}})
+    )
+    http_client = client.client
+    await client.get_group("biscuits_group")
+    await client.get_user("biscuit_eater")
+    assert client.client is http_client
+    await client.close()
+    assert http_client.is_closed
+
+
+@pytest.mark.parametrize("cache_fallback", [True, False])
+@pytest.mark.parametrize(
+    "error", [httpx.Response(503), httpx.ConnectError("FASJSON is down")], ids=["503", "connect"]
+)
+async def test_get_user_cache_fallback(respx_mock, cache_fallback, error):
+    client = FasjsonClient("http://fasjson.example.com", cache_fallback=cache_fallback)
+    route = respx_mock.get("http://fasjson.example.com/v1/users/biscuit_eater/")
+    route.return_value = httpx.Response(200, json={"result": {"username": "biscuit_eater"}})
+    assert await client.get_user("biscuit_eater") == {"username": "biscuit_eater"}
+    # The record expired
+    client._user_cache.clear()
+
+    route.side_effect = [error]
+    if cache_fallback:
+        assert await client.get_user("biscuit_eater") == {"username": "biscuit_eater"}
+    else:
+        # Nothing is kept around if the fallback is disabled
+        assert len(client._fallback_cache) == 0
+        with pytest.raises((InfoGatherError, httpx.ConnectError)):
+            await client.get_user("biscuit_eater")
+    assert route.call_count == 2
+
+
+@pytest.mark.parametrize("params", [None, {"fakeparam": True}])
+async def test_get_user_cache_fallback_unknown(respx_mock, params):
+    client = FasjsonClient("http://fasjson.example.com", cache_fallback=True)
+    client._fallback_cache["biscuit_eater"] = {"username": "biscuit_eater"}
+    respx_mock.get("http://fasjson.example.com/v1/users/cookie_eater/").mock(
+        return_value=httpx.Response(503)
+    )
+    respx_mock.get("http://fasjson.example.com/v1/users/biscuit_eater/").mock(
+        return_value=httpx.Response(503)
+    )
+    # Never looked up before
+    with pytest.raises(InfoGatherError, match=re.escape("(code 503)")):
+        await client.get_user("cookie_eater", params=params)
+    if params is not None:
+        # Lookups with extra params don't use the fallback
+        with pytest.raises(InfoGatherError, match=re.escape("(code 503)")):
+            await client.get_user("biscuit_eater", params=params)
+
+
+@pytest.mark.parametrize("cache_fallback", [True, False])
+async def test_get_users_by_matrix_id_cache_fallback(monkeypatch, cache_fallback):
+    client = FasjsonClient("http://fasjson.example.com", cache_fallback=cache_fallback)
+    mock_search_users = mock.AsyncMock(
+        side_effect=[
+            [{"username": "biscuit_eater"}],
+            InfoGatherError("Sorry, could not get info from FASJSON (code 503)"),
+        ]
+    )
+    monkeypatch.setattr(client, "search_users", mock_search_users)
+    assert await client.get_users_by_matrix_id("@cookie:biscuit.test") == {
+        "username": "biscuit_eater"
+    }
+    # The search result expired
+    client._matrix_cache.clear()
+    if cache_fallback:
+        result = await client.get_users_by_matrix_id("@cookie:biscuit.test")
+        assert result == {"username": "biscuit_eater"}
+    else:
+        with pytest.raises(InfoGatherError):
+            await client.get_users_by_matrix_id("@cookie:biscuit.test")
+
+
+@pytest.mark.parametrize(
+    "mxid,use_regex",
+    [
+        ("@cookie:fedora.im", False),
+        ("@cookie:fedora.im please", True),
+        ("hello @cookie:fedora.im", True),
+    ],
+)
+async def test_get_users_by_matrix_id_fedora_im(monkeypatch, mxid, use_regex):
+    client = FasjsonClient("http://fasjson.example.com")
+    mock_get_user = mock.AsyncMock(return_value={"username": "cookie"})
+    monkeypatch.setattr(client, "get_user", mock_get_user)
+    mock_regex = mock.Mock(wraps=fedora.clients.fasjson.MATRIX_USER_RE)
+    monkeypatch.setattr(fedora.clients.fasjson, "MATRIX_USER_RE", mock_regex)
+
+    result = await client.get_users_by_matrix_id(mxid)
+    assert result == {"username": "cookie"}
+    mock_get_user.assert_called_once_with("cookie")
+    assert mock_regex.findall.called == use_regex
+
+
+async def test_cache_policy():
+    client = FasjsonClient("http://fasjson.example.com", cache_policy={"normal": 10})
+    assert client._user_cache.ttl == 10
+    assert client._unknown_user_cache.ttl == 60
+    assert client._group_membership_cache.ttl == 60
+    assert client._group_cache.ttl == 3600
+
+
+@pytest.mark.parametrize(
+    "method,args,expected_url",
+    [
+        ("get_group", ["sysadmin-main"], "groups/sysadmin-main"),
+        ("get_group_membership", ["sysadmin-main", "members"], "groups/sysadmin-main/members"),
+    ],
+)
+async def test_get_group_cached(monkeypatch, method, args, expected_url):
+    client = FasjsonClient("http://fasjson.example.com")
+    mock__get = mock.AsyncMock(return_value=httpx.Response(200, json={"result": ["biscuits"]}))
+    monkeypatch.setattr(client, "_get", mock__get)
+
+    first = await getattr(client, method)(*args)
+    second = await getattr(client, method)(*args)
+    assert first == second == ["biscuits"]
+    assert mock__get.call_count == 1
+    assert mock__get.call_args.args == (expected_url,)
+
+    # Lookups with extra params are not cached
+    await getattr(client, method)(*args, params={"fakeparam": True})
+    assert mock__get.call_count == 2
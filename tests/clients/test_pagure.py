@@ -1,3 +1,5 @@
+import logging
+import re
 from unittest import mock
 
 import httpx
@@ -52,3 +54,30 @@ async def test_errors(respx_mock, errorcode, expected_result):
     )
     with pytest.raises(InfoGatherError, match=(expected_result)):
         await client.get_issue("project_biscuits", "1234")
+
+
+async def test_client_reused(respx_mock):
+    client = PagureClient("http://pagure.example.com")
+    respx_mock.get("http://pagure.example.com").mock(
+        return_value=httpx.Response(200, json={"title": "Dummy Issue"})
+    )
+    http_client = client.client
+    await client.get_issue("biscuits", "1")
+    await client.get_issue("biscuits", "2")
+    assert client.client is http_client
+    assert not http_client.is_closed
+    await client.close()
+    assert http_client.is_closed
+
+
+async def test_request_timing_logged(respx_mock, caplog):
+    client = PagureClient("http://pagure.example.com")
+    respx_mock.get("http://pagure.example.com").mock(
+        return_value=httpx.Response(200, json={"title": "Dummy Issue"})
+    )
+    with caplog.at_level(logging.DEBUG, logger="fedora.clients.pagure"):
+        await client.get_issue("biscuits", "1")
+    assert re.match(
+        r"^Pagure request to http://pagure.example.com/api/0/biscuits/issue/1 took \d+\.\d{3}s$",
+        caplog.messages[-1],
+    )
@@ -69,6 +69,7 @@ async def plugin(bot, db):
         )
         await instance.internal_start()
         yield instance
+        await instance.internal_stop()
 
 
 @pytest.fixture
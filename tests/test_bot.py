@@ -1,7 +1,13 @@
 from pathlib import Path
+from unittest import mock
 
+import pytest
 from ruamel.yaml import YAML
 
+import fedora
+from fedora.distgit import DistGitHandler
+from fedora.pagureio import PagureIOHandler
+
 
 async def test_version(bot, plugin):
     base_path = Path(__file__).parent.parent
@@ -58,3 +64,29 @@ async def test_help_command_unknown(bot, plugin):
     assert len(bot.sent) == 1
     expected = "> <@dummy:example.com> !help biscuits\n\n`biscuits` is not a valid command"
     assert bot.sent[0].content.body == expected
+
+
+async def test_stop_closes_clients(plugin):
+    handlers = {type(handler): handler for handler in plugin.handlers}
+    await plugin.internal_stop()
+    assert handlers[PagureIOHandler].pagureioclient.client.is_closed
+    assert handlers[DistGitHandler].paguredistgitclient.client.is_closed
+    assert plugin.fasjsonclient.client.is_closed
+
+
+async def test_stop_after_failed_start(plugin, monkeypatch):
+    # Don't leak the clients of the fixture's successful start
+    await plugin.stop()
+    monkeypatch.setattr(fedora, "DistGitHandler", mock.Mock(side_effect=ValueError("boom")))
+    with pytest.raises(ValueError, match="boom"):
+        await plugin.start()
+    assert [type(handler) for handler in plugin.handlers] == [PagureIOHandler]
+    await plugin.stop()
+    assert plugin.handlers[0].pagureioclient.client.is_closed
+    assert plugin.fasjsonclient.client.is_closed
+
+
+async def test_stop_without_fasjsonclient(plugin):
+    await plugin.fasjsonclient.close()
+    del plugin.fasjsonclient
+    await plugin.stop()
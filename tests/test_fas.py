@@ -1,11 +1,16 @@
+import asyncio
 from datetime import datetime, timezone
 from unittest import mock
+from zoneinfo import ZoneInfo
 
 import httpx
 import pytest
-import pytz
+from maubot.matrix import MaubotMessageEvent
 
 import fedora
+from fedora.fas import FasHandler
+
+from .bot import make_message
 
 
 async def test_group_info(bot, plugin, respx_mock):
@@ -75,25 +80,108 @@ async def test_group_members(bot, plugin, respx_mock, membership_type, groupname
         )
 
 
-async def test_group_members_notagroup(bot, plugin, respx_mock):
+async def test_group_members_notagroup(bot, plugin, respx_mock, monkeypatch):
     respx_mock.get("http://fasjson.example.com/v1/groups/notagroup/members/").mock(
         return_value=httpx.Response(404),
     )
+    monkeypatch.setattr(bot.client, "get_joined_members", mock.AsyncMock(return_value=dict()))
     await bot.send("!group members notagroup")
     assert len(bot.sent) == 1
     assert bot.sent[0].content.body == "Sorry, but group 'notagroup' does not exist"
 
 
-async def test_group_members_massive_group(bot, plugin, respx_mock):
+@pytest.mark.parametrize(
+    "error", [httpx.Response(404), httpx.ConnectError("FASJSON is down")], ids=["404", "connect"]
+)
+async def test_group_members_room_members_cancelled(bot, plugin, respx_mock, monkeypatch, error):
+    respx_mock.get("http://fasjson.example.com/v1/groups/dummygroup/members/").mock(
+        side_effect=[error]
+    )
+
+    async def get_joined_members(room_id):
+        # Never answers, the lookup must be cancelled
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(bot.client, "get_joined_members", get_joined_members)
+    handler = next(h for h in plugin.handlers if isinstance(h, FasHandler))
+    evt = MaubotMessageEvent(make_message("!group members dummygroup"), bot.client)
+    if isinstance(error, Exception):
+        with pytest.raises(httpx.ConnectError):
+            await handler._list_members(evt, "dummygroup", "members")
+    else:
+        await handler._list_members(evt, "dummygroup", "members")
+        assert bot.sent[0].content.body == "Sorry, but group 'dummygroup' does not exist"
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+    pending = [
+        task
+        for task in asyncio.all_tasks()
+        if task.get_coro().__qualname__ == "FasHandler._get_room_members"
+    ]
+    assert pending == []
+
+
+async def test_group_members_single_message(bot, plugin, respx_mock, monkeypatch):
+    respx_mock.get("http://fasjson.example.com/v1/groups/biggroup/members/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "result": [
+                    {"username": f"member{n:03}", "ircnicks": [f"matrix:/member{n:03}"]}
+                    for n in range(1, 201)
+                ]
+            },
+        ),
+    )
+    monkeypatch.setattr(bot.client, "get_joined_members", mock.AsyncMock(return_value=dict()))
+    await bot.send("!group members biggroup")
+    # Up to 200 members fit in one message, with mentions
+    assert len(bot.sent) == 1
+    assert bot.sent[0].content.body.startswith("Members of biggroup: ")
+    assert bot.sent[0].content.formatted_body.count("https://matrix.to/") == 200
+
+
+async def test_group_members_large_group(bot, plugin, respx_mock, monkeypatch):
+    respx_mock.get("http://fasjson.example.com/v1/groups/largegroup/members/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "result": [
+                    {"username": f"member{n}", "ircnicks": [f"matrix:/member{n}"]}
+                    for n in range(1, 300)
+                ]
+            },
+        ),
+    )
+    monkeypatch.setattr(bot.client, "get_joined_members", mock.AsyncMock(return_value=dict()))
+    await bot.send("!group members largegroup")
+    assert len(bot.sent) == 3
+    # Members are sorted by username
+    usernames = sorted(f"member{n}" for n in range(1, 300))
+    for sent, (first, last) in zip(bot.sent, [(1, 100), (101, 200), (201, 299)], strict=True):
+        members = ", ".join(usernames[first - 1 : last])
+        assert sent.content.body == f"Members of largegroup ({first}-{last} of 299): {members}"
+        # Nobody gets pinged
+        assert "matrix.to" not in (sent.content.formatted_body or "")
+
+
+async def test_group_members_massive_group(bot, plugin, respx_mock, monkeypatch):
     respx_mock.get("http://fasjson.example.com/v1/groups/massivegroup/members/").mock(
         return_value=httpx.Response(
-            200, json={"result": [{"username": f"member{n}"} for n in range(1, 300)]}
+            200, json={"result": [{"username": f"member{n:04}"} for n in range(1, 1235)]}
         ),
     )
+    monkeypatch.setattr(bot.client, "get_joined_members", mock.AsyncMock(return_value=dict()))
     await bot.send("!group members massivegroup")
-    assert len(bot.sent) == 1
-    assert (
-        bot.sent[0].content.body == "massivegroup has 299 members and thats too many to dump here"
+    assert len(bot.sent) == 11
+    assert bot.sent[0].content.body.startswith(
+        "Members of massivegroup (1-100 of 1234): member0001, member0002, "
+    )
+    assert bot.sent[9].content.body.startswith("Members of massivegroup (901-1000 of 1234): ")
+    assert bot.sent[9].content.body.endswith(", member1000")
+    assert bot.sent[10].content.body == (
+        "... and 234 more, see https://accounts.fedoraproject.org/group/massivegroup/"
     )
 
 
@@ -259,6 +347,7 @@ async def test_hello_with_username(bot, plugin, respx_mock, monkeypatch, alias):
     [
         ("Europe/Paris", 'The current local time of "dummy" is: '),
         ("Cookieland/BiscuitTown", 'The timezone of "dummy" was unknown: "Cookieland/BiscuitTown"'),
+        ("Europe", 'The timezone of "dummy" was unknown: "Europe"'),
         (None, 'User "dummy" doesn\'t share their timezone'),
     ],
 )
@@ -282,7 +371,7 @@ async def test_localtime(bot, plugin, respx_mock, monkeypatch, tz, response, com
     await bot.send(command)
     assert len(bot.sent) == 1
     if bot.sent[0].content.body.startswith('The current local time of "dummy" is: '):
-        expected_time = fake_now.astimezone(pytz.timezone(tz))
+        expected_time = fake_now.astimezone(ZoneInfo(tz))
         expected = f'{response}"{expected_time.strftime("%H:%M")}" (timezone: {tz})'
     else:
         expected = f"> <@dummy:example.com> {command}\n\n{response}"
@@ -318,3 +407,25 @@ async def test_user_info(bot, plugin, respx_mock, alias):
         "GPG Key IDs: None"
     )
     assert bot.sent[0].content.body == expected
+
+
+async def test_localtime_cached(bot, plugin, respx_mock, monkeypatch):
+    respx_mock.get("http://fasjson.example.com/v1/users/dummy/").mock(
+        return_value=httpx.Response(
+            200, json={"result": {"username": "dummy", "timezone": "Europe/Paris"}}
+        )
+    )
+    fake_now = datetime(2023, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    datetime_mock = mock.MagicMock(wraps=datetime)
+    datetime_mock.now.side_effect = fake_now.astimezone
+    monkeypatch.setattr(fedora.fas, "datetime", datetime_mock)
+    get_timezone = mock.Mock(wraps=fedora.fas.get_timezone)
+    monkeypatch.setattr(fedora.fas, "get_timezone", get_timezone)
+
+    await bot.send("!localtime dummy")
+    await bot.send("!localtime dummy")
+    assert len(bot.sent) == 2
+    expected = 'The current local time of "dummy" is: "01:00" (timezone: Europe/Paris)'
+    assert bot.sent[0].content.body == expected
+    assert bot.sent[1].content.body == expected
+    get_timezone.assert_called_once_with("Europe/Paris")
@@ -47,6 +47,21 @@ async def test_oncall_list(bot, plugin, db, freeze_datetime, listcommands):
     assert bot.sent[0].content.body == expected
 
 
+async def test_oncall_list_unknown_timezone(bot, plugin, db, freeze_datetime):
+    await db.execute(
+        "INSERT INTO oncall (username, mxid, timezone) "
+        "VALUES ('dummy', '@dummy:example.com', 'Europe')"
+    )
+    await bot.send("!infra oncall list", room_id="controlroom")
+    assert len(bot.sent) == 1
+    expected = (
+        "The following people are oncall:\n\n● @dummy:example.com (dummy) Current Time "
+        "for them: unknown (Europe)\nIf they do not respond, please file a ticket "
+        "(https://pagure.io/fedora-infrastructure/issues)"
+    )
+    assert bot.sent[0].content.body == expected
+
+
 @pytest.fixture
 def ircnick(response):
     if "ircnicks" in response and len(response["ircnicks"]) > 0:
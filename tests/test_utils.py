@@ -118,6 +118,28 @@ async def test_get_fasuser_double(bot, plugin, respx_mock, username, mention):
     assert str(exc.value) == "Sorry, I can only look up one username at a time"
 
 
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        ("<p>!hello dummy</p>", []),
+        (f"<p>!hello {_make_mention('@dummy:fedora.im', 'Dummy')}</p>", ["@dummy:fedora.im"]),
+        ("<a href='http://matrix.to/#/@dummy:fedora.im'>Dummy</a>", ["@dummy:fedora.im"]),
+        ("<a href=https://matrix.to/#/@dummy:fedora.im>Dummy</a>", ["@dummy:fedora.im"]),
+        # Not a link
+        ("<p>see https://matrix.to/#/@dummy:fedora.im </p>", []),
+        # Unterminated
+        ('<a href="https://matrix.to/#/@dummy:fedora.im', []),
+        (
+            f"<p>{_make_mention('@dummy:fedora.im')} {_make_mention('@dummy2:fedora.im')} "
+            f"{_make_mention('@dummy3:fedora.im')}</p>",
+            ["@dummy:fedora.im", "@dummy2:fedora.im"],
+        ),
+    ],
+)
+def test_find_mentions(body, expected):
+    assert fedora.utils.find_mentions(body) == expected
+
+
 def test_get_rowcount_postgres():
     class mock_db:
         def __init__(self):